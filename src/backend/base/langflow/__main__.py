@@ -400,6 +400,9 @@ def run_langflow(host, port, log_level, options, app):
                 port=port,
                 log_level=log_level.lower(),
                 loop="asyncio",
+                # Negotiate permessage-deflate so large batched frames
+                # compress on the wire
+                ws_per_message_deflate=True,
             )
         else:
             from langflow.server import LangflowApplication
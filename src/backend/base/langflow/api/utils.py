@@ -9,6 +9,7 @@ from sqlmodel import Session
 from langflow.graph.graph.base import Graph
 from langflow.services.chat.service import ChatService
 from langflow.services.database.models.flow import Flow
+from langflow.services.session.utils import compute_dict_hash
 from langflow.services.store.schema import StoreComponentCreate
 from langflow.services.store.utils import get_lf_version_from_pypi
 
@@ -211,11 +212,18 @@ async def build_and_cache_graph(
     flow: Optional[Flow] = session.get(Flow, flow_id)
     if not flow or not flow.data:
         raise ValueError("Invalid flow ID")
+    # Skip rebuilding entirely when the cached graph was built from an
+    # identical payload; the hash travels with the graph so the check
+    # survives cache round-trips.
+    data_hash = compute_dict_hash(flow.data)
+    if graph is not None and getattr(graph, "_data_hash", None) == data_hash:
+        return graph
     other_graph = Graph.from_payload(flow.data, flow_id)
     if graph is None:
         graph = other_graph
     else:
         graph = graph.update(other_graph)
+    graph._data_hash = data_hash
     await chat_service.set_cache(flow_id, graph)
     return graph
 
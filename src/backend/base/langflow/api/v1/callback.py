@@ -1,3 +1,4 @@
+import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import UUID
 
@@ -13,10 +14,22 @@ if TYPE_CHECKING:
     from langflow.services.socket.service import SocketIOService
 
 
+# Serialized once at import time; hot paths shallow-copy it and fill in
+# the field that actually changes instead of re-validating and dumping a
+# fresh ChatResponse per frame.
+_STREAM_RESP_SKELETON = ChatResponse(message="", type="stream", intermediate_steps="").model_dump()
+
+
 # https://github.com/hwchase17/chat-langchain/blob/master/callback.py
 class AsyncStreamingLLMCallbackHandleSIO(AsyncCallbackHandler):
     """Callback handler for streaming LLM responses."""
 
+    # Tokens are buffered and flushed every FLUSH_INTERVAL seconds (or
+    # once the buffer holds MAX_BUFFERED_TOKENS) so a fast stream sends
+    # a few larger frames instead of one frame per token.
+    FLUSH_INTERVAL = 0.01
+    MAX_BUFFERED_TOKENS = 64
+
     @property
     def ignore_chain(self) -> bool:
         """Whether to ignore chain callbacks."""
@@ -27,20 +40,58 @@ class AsyncStreamingLLMCallbackHandleSIO(AsyncCallbackHandler):
         self.client_id = session_id
         self.socketio_service: "SocketIOService" = get_socket_service()
         self.sid = session_id
+        self._buffer: List[str] = []
+        self._buffer_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
         # self.socketio_service = self.chat_service.active_connections[self.client_id]
 
+    async def _flush_tokens(self) -> None:
+        if not self._buffer:
+            return
+        message = "".join(self._buffer)
+        self._buffer.clear()
+        # Hot path: the payload is the constant skeleton plus the text, so
+        # skip ChatResponse construction and validation entirely.
+        resp = {**_STREAM_RESP_SKELETON, "message": message}
+        await self.socketio_service.emit_token(to=self.sid, data=resp)
+
+    async def _flush_loop(self) -> None:
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._buffer_event.wait(), timeout=self.FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                self._buffer_event.clear()
+                await self._flush_tokens()
+        except asyncio.CancelledError:
+            await self._flush_tokens()
+
     async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
-        resp = ChatResponse(message=token, type="stream", intermediate_steps="")
-        await self.socketio_service.emit_token(to=self.sid, data=resp.model_dump())
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        self._buffer.append(token)
+        if len(self._buffer) >= self.MAX_BUFFERED_TOKENS:
+            self._buffer_event.set()
+
+    async def _stop_flush_loop(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._flush_tokens()
+
+    async def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+        """Run when LLM ends running; flush any buffered tokens."""
+        await self._stop_flush_loop()
+
+    async def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        """Run when LLM errors; stop the flush loop and flush partial tokens."""
+        await self._stop_flush_loop()
 
     async def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs: Any) -> Any:
         """Run when tool starts running."""
-        resp = ChatResponse(
-            message="",
-            type="stream",
-            intermediate_steps=f"Tool input: {input_str}",
-        )
-        await self.socketio_service.emit_token(to=self.sid, data=resp.model_dump())
+        resp = {**_STREAM_RESP_SKELETON, "intermediate_steps": f"Tool input: {input_str}"}
+        await self.socketio_service.emit_token(to=self.sid, data=resp)
 
     async def on_tool_end(self, output: str, **kwargs: Any) -> Any:
         """Run when tool ends running."""
@@ -51,27 +102,16 @@ class AsyncStreamingLLMCallbackHandleSIO(AsyncCallbackHandler):
         # Create a formatted message.
         intermediate_steps = f"{observation_prefix}{first_word}"
 
-        # Create a ChatResponse instance.
-        resp = ChatResponse(
-            message="",
-            type="stream",
-            intermediate_steps=intermediate_steps,
-        )
-        rest_of_resps = [
-            ChatResponse(
-                message="",
-                type="stream",
-                intermediate_steps=f"{word}",
-            )
-            for word in rest_of_output
-        ]
-        resps = [resp] + rest_of_resps
+        # Vary only the changing field instead of building and dumping a
+        # model per word.
+        resps = [{**_STREAM_RESP_SKELETON, "intermediate_steps": intermediate_steps}]
+        resps.extend({**_STREAM_RESP_SKELETON, "intermediate_steps": word} for word in rest_of_output)
         # Try to send the response, handle potential errors.
 
         try:
             # This is to emulate the stream of tokens
             for resp in resps:
-                await self.socketio_service.emit_token(to=self.sid, data=resp.model_dump())
+                await self.socketio_service.emit_token(to=self.sid, data=resp)
         except Exception as exc:
             logger.error(f"Error sending response: {exc}")
 
@@ -94,9 +134,9 @@ class AsyncStreamingLLMCallbackHandleSIO(AsyncCallbackHandler):
         if "Prompt after formatting" in text:
             text = text.replace("Prompt after formatting:\n", "")
             text = remove_ansi_escape_codes(text)
-            resp = PromptResponse(
-                prompt=text,
-            )
+            # The prompt text is already a validated str; model_construct
+            # skips pydantic validation on this internal construction.
+            resp = PromptResponse.model_construct(prompt=text)
             await self.socketio_service.emit_message(to=self.sid, data=resp.model_dump())
 
     async def on_agent_action(self, action: AgentAction, **kwargs: Any):
@@ -104,19 +144,14 @@ class AsyncStreamingLLMCallbackHandleSIO(AsyncCallbackHandler):
         # if there are line breaks, split them and send them
         # as separate messages
         if "\n" in log:
-            logs = log.split("\n")
-            for log in logs:
-                resp = ChatResponse(message="", type="stream", intermediate_steps=log)
-                await self.socketio_service.emit_token(to=self.sid, data=resp.model_dump())
+            for line in log.split("\n"):
+                resp = {**_STREAM_RESP_SKELETON, "intermediate_steps": line}
+                await self.socketio_service.emit_token(to=self.sid, data=resp)
         else:
-            resp = ChatResponse(message="", type="stream", intermediate_steps=log)
-            await self.socketio_service.emit_token(to=self.sid, data=resp.model_dump())
+            resp = {**_STREAM_RESP_SKELETON, "intermediate_steps": log}
+            await self.socketio_service.emit_token(to=self.sid, data=resp)
 
     async def on_agent_finish(self, finish: AgentFinish, **kwargs: Any) -> Any:
         """Run on agent end."""
-        resp = ChatResponse(
-            message="",
-            type="stream",
-            intermediate_steps=finish.log,
-        )
-        await self.socketio_service.emit_token(to=self.sid, data=resp.model_dump())
+        resp = {**_STREAM_RESP_SKELETON, "intermediate_steps": finish.log}
+        await self.socketio_service.emit_token(to=self.sid, data=resp)
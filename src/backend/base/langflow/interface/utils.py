@@ -1,10 +1,11 @@
-import base64
-import json
+import asyncio
 import os
 import re
 from io import BytesIO
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional
 
+import orjson
 import yaml
 from docstring_parser import parse
 from langchain.base_language import BaseLanguageModel
@@ -14,19 +15,27 @@ from langflow.utils.util import format_dict, get_base_classes, get_default_facto
 from loguru import logger
 from PIL.Image import Image
 
+try:
+    # SIMD-accelerated, API-compatible replacement for the stdlib encoder
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
 
 def load_file_into_dict(file_path: str) -> dict:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
     # Files names are UUID, so we can't find the extension
-    with open(file_path, "r") as file:
+    # orjson parses the raw bytes directly, skipping the text decode
+    # the stdlib json.load would do first
+    raw_data = Path(file_path).read_bytes()
+    try:
+        data = orjson.loads(raw_data)
+    except orjson.JSONDecodeError:
         try:
-            data = json.load(file)
-        except json.JSONDecodeError:
-            file.seek(0)
-            data = yaml.safe_load(file)
-        except ValueError as exc:
+            data = yaml.safe_load(raw_data)
+        except yaml.YAMLError as exc:
             raise ValueError("Invalid file type. Expected .json or .yaml.") from exc
     return data
 
@@ -34,10 +43,36 @@ def load_file_into_dict(file_path: str) -> dict:
 def pil_to_base64(image: Image) -> str:
     buffered = BytesIO()
     image.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue())
+    # getbuffer() exposes the encoded bytes without the copy getvalue() makes
+    img_str = b64encode(buffered.getbuffer())
     return img_str.decode("utf-8")
 
 
+async def apil_to_base64(image: Image) -> str:
+    # PNG encoding and base64 are CPU-bound and would block the event
+    # loop for large images, so run them in a worker thread.
+    return await asyncio.to_thread(pil_to_base64, image)
+
+
+# Maps each LLM class to the attribute that toggles streaming on it
+# ("streaming", "stream" or None), so the hasattr/isinstance probing
+# below runs once per class instead of on every call.
+_streaming_attr_by_class: Dict[type, Optional[str]] = {}
+
+
+def _get_streaming_attr(llm) -> Optional[str]:
+    llm_class = type(llm)
+    if llm_class not in _streaming_attr_by_class:
+        attr = None
+        if isinstance(llm, BaseLanguageModel):
+            if hasattr(llm, "streaming") and isinstance(llm.streaming, bool):
+                attr = "streaming"
+            elif hasattr(llm, "stream") and isinstance(llm.stream, bool):
+                attr = "stream"
+        _streaming_attr_by_class[llm_class] = attr
+    return _streaming_attr_by_class[llm_class]
+
+
 def try_setting_streaming_options(langchain_object):
     # If the LLM type is OpenAI or ChatOpenAI,
     # set streaming to True
@@ -48,11 +83,8 @@ def try_setting_streaming_options(langchain_object):
     elif hasattr(langchain_object, "llm_chain") and hasattr(langchain_object.llm_chain, "llm"):
         llm = langchain_object.llm_chain.llm
 
-    if isinstance(llm, BaseLanguageModel):
-        if hasattr(llm, "streaming") and isinstance(llm.streaming, bool):
-            llm.streaming = ChatConfig.streaming
-        elif hasattr(llm, "stream") and isinstance(llm.stream, bool):
-            llm.stream = ChatConfig.streaming
+    if llm is not None and (attr := _get_streaming_attr(llm)):
+        setattr(llm, attr, ChatConfig.streaming)
 
     return langchain_object
 
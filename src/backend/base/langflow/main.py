@@ -17,6 +17,7 @@ from langflow.api import router
 from langflow.initial_setup.setup import create_or_update_starter_projects
 from langflow.interface.utils import setup_llm_caching
 from langflow.services.plugins.langfuse_plugin import LangfuseInstance
+from langflow.services.socket.utils import OrjsonSerializer
 from langflow.services.utils import initialize_services, teardown_services
 from langflow.utils.logger import configure
 
@@ -64,7 +65,9 @@ def create_app():
     """Create the FastAPI app and include the router."""
 
     configure()
-    socketio_server = socketio.AsyncServer(async_mode="asgi", cors_allowed_origins="*", logger=True)
+    socketio_server = socketio.AsyncServer(
+        async_mode="asgi", cors_allowed_origins="*", logger=True, json=OrjsonSerializer
+    )
     lifespan = get_lifespan(socketio_server=socketio_server)
     app = FastAPI(lifespan=lifespan)
     origins = ["*"]
@@ -161,4 +164,5 @@ if __name__ == "__main__":
         log_level="error",
         reload=True,
         loop="asyncio",
+        ws_per_message_deflate=True,
     )
@@ -10,7 +10,9 @@ from langflow.utils.logger import InterceptHandler  # type: ignore
 
 
 class LangflowUvicornWorker(UvicornWorker):
-    CONFIG_KWARGS = {"loop": "asyncio"}
+    # permessage-deflate lets the websocket transport compress the large
+    # coalesced token frames before they hit the wire
+    CONFIG_KWARGS = {"loop": "asyncio", "ws_per_message_deflate": True}
 
     def _install_sigint_handler(self) -> None:
         """Install a SIGQUIT handler on workers.
@@ -46,25 +46,21 @@ def clear_old_cache_files(max_cache_size: int = 3):
 
 
 def filter_json(json_data):
+    # The input may be a live payload (e.g. a Flow model's data), so build
+    # filtered copies instead of deleting keys from the caller's dicts.
     filtered_data = json_data.copy()
 
     # Remove 'viewport' and 'chatHistory' keys
-    if "viewport" in filtered_data:
-        del filtered_data["viewport"]
-    if "chatHistory" in filtered_data:
-        del filtered_data["chatHistory"]
+    filtered_data.pop("viewport", None)
+    filtered_data.pop("chatHistory", None)
 
     # Filter nodes
     if "nodes" in filtered_data:
-        for node in filtered_data["nodes"]:
-            if "position" in node:
-                del node["position"]
-            if "positionAbsolute" in node:
-                del node["positionAbsolute"]
-            if "selected" in node:
-                del node["selected"]
-            if "dragging" in node:
-                del node["dragging"]
+        ui_keys = ("position", "positionAbsolute", "selected", "dragging")
+        filtered_data["nodes"] = [
+            {key: value for key, value in node.items() if key not in ui_keys} if isinstance(node, dict) else node
+            for node in filtered_data["nodes"]
+        ]
 
     return filtered_data
 
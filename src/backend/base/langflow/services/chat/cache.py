@@ -1,4 +1,5 @@
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, Awaitable, Callable, List, Optional
 
 import pandas as pd
@@ -8,46 +9,50 @@ from langflow.services.base import Service
 
 
 class Subject:
-    """Base class for implementing the observer pattern."""
+    """Maintains a flat list of callbacks and invokes them on notify.
+
+    Callbacks are validated when attached, so notify is a plain loop of
+    direct calls with no per-observer guards.
+    """
 
     def __init__(self):
         self.observers: List[Callable[[], None]] = []
 
     def attach(self, observer: Callable[[], None]):
-        """Attach an observer to the subject."""
+        """Attach an observer callback to the subject."""
+        if not callable(observer):
+            raise TypeError("observer must be callable")
         self.observers.append(observer)
 
     def detach(self, observer: Callable[[], None]):
-        """Detach an observer from the subject."""
+        """Detach an observer callback from the subject."""
         self.observers.remove(observer)
 
     def notify(self):
-        """Notify all observers about an event."""
+        """Invoke all observer callbacks."""
         for observer in self.observers:
-            if observer is None:
-                continue
             observer()
 
 
 class AsyncSubject:
-    """Base class for implementing the async observer pattern."""
+    """Async counterpart of Subject for coroutine callbacks."""
 
     def __init__(self):
         self.observers: List[Callable[[], Awaitable]] = []
 
     def attach(self, observer: Callable[[], Awaitable]):
-        """Attach an observer to the subject."""
+        """Attach an observer callback to the subject."""
+        if not callable(observer):
+            raise TypeError("observer must be callable")
         self.observers.append(observer)
 
     def detach(self, observer: Callable[[], Awaitable]):
-        """Detach an observer from the subject."""
+        """Detach an observer callback from the subject."""
         self.observers.remove(observer)
 
     async def notify(self):
-        """Notify all observers about an event."""
+        """Invoke and await all observer callbacks."""
         for observer in self.observers:
-            if observer is None:
-                continue
             await observer()
 
 
@@ -59,25 +64,32 @@ class CacheService(Subject, Service):
     def __init__(self):
         super().__init__()
         self._cache = {}
-        self.current_client_id = None
-        self.current_cache = {}
+        self._current_client_id: ContextVar[Optional[str]] = ContextVar("current_client_id", default=None)
+
+    @property
+    def current_client_id(self) -> Optional[str]:
+        return self._current_client_id.get()
+
+    @property
+    def current_cache(self) -> dict:
+        return self._cache.setdefault(self.current_client_id, {})
 
     @contextmanager
     def set_client_id(self, client_id: str):
         """
-        Context manager to set the current client_id and associated cache.
+        Context manager to set the current client_id for the calling context.
+
+        Backed by a ContextVar, so concurrent tasks and threads each see
+        their own client_id instead of racing over shared instance state.
 
         Args:
             client_id (str): The client identifier.
         """
-        previous_client_id = self.current_client_id
-        self.current_client_id = client_id
-        self.current_cache = self._cache.setdefault(client_id, {})
+        token = self._current_client_id.set(client_id)
         try:
             yield
         finally:
-            self.current_client_id = previous_client_id
-            self.current_cache = self._cache.get(self.current_client_id, {})
+            self._current_client_id.reset(token)
 
     def add(self, name: str, obj: Any, obj_type: str, extension: Optional[str] = None):
         """
@@ -112,7 +124,9 @@ class CacheService(Subject, Service):
             obj (Any): The pandas DataFrame or Series object.
         """
         if isinstance(obj, (pd.DataFrame, pd.Series)):
-            self.add(name, obj.to_csv(), "pandas", extension="csv")
+            # Explicit lineterminator skips the per-line newline translation
+            # pandas otherwise does when writing to an in-memory buffer
+            self.add(name, obj.to_csv(lineterminator="\n"), "pandas", extension="csv")
         else:
             raise ValueError("Object is not a pandas DataFrame or Series")
 
@@ -148,7 +162,9 @@ class CacheService(Subject, Service):
         Returns:
             The last added item in the cache.
         """
-        return list(self.current_cache.values())[-1]
+        # Dicts preserve insertion order, so the last value is reachable
+        # in O(1) without copying the whole cache into a list.
+        return next(reversed(self.current_cache.values()))
 
 
 cache_service = CacheService()
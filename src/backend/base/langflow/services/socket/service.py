@@ -1,5 +1,7 @@
+import asyncio
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import socketio  # type: ignore
 from loguru import logger
 
@@ -14,6 +16,14 @@ if TYPE_CHECKING:
 class SocketIOService(Service):
     name = "socket_service"
 
+    # Caps for the coalescing writer: flush once a batch reaches either
+    # limit so a sustained burst never turns into one oversized frame.
+    MAX_BATCH_MESSAGES = 128
+    MAX_BATCH_BYTES = 64 * 1024
+    # Bound on queued-but-unsent messages per client; producers block once
+    # a client falls this far behind instead of buffering without limit.
+    MAX_QUEUED_MESSAGES = 1024
+
     def __init__(self, cache_service: "CacheService"):
         self.cache_service = cache_service
 
@@ -27,6 +37,8 @@ class SocketIOService(Service):
             self.sio.on("get_vertices")(self.on_get_vertices)
             self.sio.on("build_vertex")(self.on_build_vertex)
         self.sessions = {}  # type: dict[str, dict]
+        self.send_queues = {}  # type: dict[str, asyncio.Queue]
+        self.send_tasks = {}  # type: dict[str, asyncio.Task]
 
     async def emit_error(self, sid, error):
         await self.sio.emit("error", to=sid, data=error)
@@ -34,10 +46,64 @@ class SocketIOService(Service):
     async def connect(self, sid, environ):
         logger.info(f"Socket connected: {sid}")
         self.sessions[sid] = environ
+        self._ensure_writer(sid)
+
+    def _ensure_writer(self, sid) -> asyncio.Queue:
+        queue = self.send_queues.get(sid)
+        if queue is None:
+            queue = self.send_queues[sid] = asyncio.Queue(maxsize=self.MAX_QUEUED_MESSAGES)
+            self.send_tasks[sid] = asyncio.create_task(self._writer(sid))
+        return queue
 
     async def disconnect(self, sid):
         logger.info(f"Socket disconnected: {sid}")
         self.sessions.pop(sid, None)
+        self.send_queues.pop(sid, None)
+        if task := self.send_tasks.pop(sid, None):
+            task.cancel()
+
+    async def _writer(self, sid):
+        """Drain the client's send queue and emit coalesced token frames.
+
+        Blocks for the first message, then drains everything that is
+        immediately available so bursts (e.g. streaming LLM tokens) are
+        sent as a single frame instead of one emit per token. Slow
+        streams are unaffected: a lone message is sent right away.
+
+        Batches are bounded by MAX_BATCH_MESSAGES and MAX_BATCH_BYTES;
+        when either cap is hit the batch is flushed and the loop drains
+        again immediately, so bursts stay batched but every frame stays
+        a reasonable size.
+        """
+        queue = self.send_queues[sid]
+        try:
+            while True:
+                first = await queue.get()
+                # A failure on one batch (unserializable payload, transport
+                # hiccup) must not kill the writer: the queue stays
+                # registered and, once full, would block every producer
+                # forever. Log, drop the batch and keep draining.
+                try:
+                    batch = [first]
+                    total_bytes = len(orjson.dumps(first))
+                    while len(batch) < self.MAX_BATCH_MESSAGES and total_bytes < self.MAX_BATCH_BYTES:
+                        try:
+                            message = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
+                        batch.append(message)
+                        total_bytes += len(orjson.dumps(message))
+                    await self.sio.emit("token", to=sid, data={"type": "batch", "data": batch})
+                except Exception as exc:
+                    logger.error(f"Error writing to socket {sid}: {exc}")
+        except asyncio.CancelledError:
+            pass
+        finally:
+            # If the task ever exits for a reason other than disconnect(),
+            # deregister so producers don't enqueue into a dead writer.
+            if self.send_tasks.get(sid) is asyncio.current_task():
+                self.send_queues.pop(sid, None)
+                self.send_tasks.pop(sid, None)
 
     async def message(self, sid, data=None):
         # Logic for handling messages
@@ -48,7 +114,23 @@ class SocketIOService(Service):
         await self.sio.emit("message", to=to, data=data)
 
     async def emit_token(self, to, data):
-        await self.sio.emit("token", to=to, data=data)
+        # Go through the per-client queue: a plain put_nowait on the
+        # running loop, with no cross-thread scheduling involved.
+        queue = self.send_queues.get(to)
+        if queue is None:
+            if to not in self.sessions:
+                # Disconnected sid (a token racing a mid-stream disconnect)
+                # or a room: creating a writer here would leak it forever,
+                # since no disconnect event will ever clean it up.
+                await self.sio.emit("token", to=to, data=data)
+                return
+            queue = self._ensure_writer(to)
+        try:
+            queue.put_nowait(data)
+        except asyncio.QueueFull:
+            # The client isn't draining; await so the producer (e.g. the
+            # streaming LLM callback) slows to the consumer's pace.
+            await queue.put(data)
 
     async def on_get_vertices(self, sid, flow_id):
         await get_vertices(self.sio, sid, flow_id, get_chat_service())
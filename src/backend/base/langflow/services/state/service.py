@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from threading import Lock
 from typing import Callable
 
@@ -28,6 +28,11 @@ class StateService(Service):
 
 
 class InMemoryStateService(StateService):
+    # Upper bound on appended states kept per key. deque(maxlen=...) drops
+    # the oldest entries, so a long-running run cannot grow memory without
+    # bound while recent state stays available to observers.
+    MAX_APPENDED_STATES = 1000
+
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
         self.states: dict = {}
@@ -39,9 +44,9 @@ class InMemoryStateService(StateService):
             if run_id not in self.states:
                 self.states[run_id] = {}
             if key not in self.states[run_id]:
-                self.states[run_id][key] = []
-            elif not isinstance(self.states[run_id][key], list):
-                self.states[run_id][key] = [self.states[run_id][key]]
+                self.states[run_id][key] = deque(maxlen=self.MAX_APPENDED_STATES)
+            elif not isinstance(self.states[run_id][key], deque):
+                self.states[run_id][key] = deque([self.states[run_id][key]], maxlen=self.MAX_APPENDED_STATES)
             self.states[run_id][key].append(new_state)
             self.notify_append_observers(key, new_state)
 
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+import langflow.api.v1.callback as callback_module
+from langflow.api.v1.callback import AsyncStreamingLLMCallbackHandleSIO
+
+
+class FakeSocketService:
+    def __init__(self):
+        self.tokens = []
+
+    async def emit_token(self, to, data):
+        self.tokens.append((to, data))
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    socket_service = FakeSocketService()
+    monkeypatch.setattr(callback_module, "get_chat_service", lambda: None)
+    monkeypatch.setattr(callback_module, "get_socket_service", lambda: socket_service)
+    return AsyncStreamingLLMCallbackHandleSIO(session_id="sid1")
+
+
+def streamed_messages(handler):
+    return [data["message"] for _, data in handler.socketio_service.tokens]
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_coalesced_into_one_frame(handler):
+    await handler.on_llm_new_token("Hello")
+    await handler.on_llm_new_token(" world")
+    await asyncio.sleep(handler.FLUSH_INTERVAL * 5)
+
+    assert streamed_messages(handler) == ["Hello world"]
+
+
+@pytest.mark.asyncio
+async def test_on_llm_end_flushes_and_stops_the_loop(handler):
+    await handler.on_llm_new_token("partial")
+    await handler.on_llm_end(response=None)
+
+    assert handler._flush_task is None
+    assert streamed_messages(handler) == ["partial"]
+
+
+@pytest.mark.asyncio
+async def test_on_llm_error_flushes_and_stops_the_loop(handler):
+    await handler.on_llm_new_token("partial")
+    await handler.on_llm_error(error=RuntimeError("LLM failed"))
+
+    assert handler._flush_task is None
+    assert streamed_messages(handler) == ["partial"]
+
+
+@pytest.mark.asyncio
+async def test_buffer_cap_forces_early_flush(handler):
+    for i in range(handler.MAX_BUFFERED_TOKENS):
+        await handler.on_llm_new_token(str(i))
+    await asyncio.sleep(handler.FLUSH_INTERVAL * 5)
+
+    assert streamed_messages(handler) == ["".join(str(i) for i in range(handler.MAX_BUFFERED_TOKENS))]
+    await handler.on_llm_end(response=None)
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from langflow.services.chat.cache import CacheService
+
+
+@pytest.mark.asyncio
+async def test_set_client_id_is_task_local():
+    service = CacheService()
+    seen = {}
+
+    async def use_client(client_id):
+        with service.set_client_id(client_id):
+            # Yield so the tasks interleave while both contexts are active
+            await asyncio.sleep(0.01)
+            seen[client_id] = service.current_client_id
+
+    await asyncio.gather(use_client("client_a"), use_client("client_b"))
+
+    assert seen == {"client_a": "client_a", "client_b": "client_b"}
+    assert service.current_client_id is None
+
+
+def test_set_client_id_restores_previous_on_exit():
+    service = CacheService()
+    with service.set_client_id("outer"):
+        with service.set_client_id("inner"):
+            assert service.current_client_id == "inner"
+        assert service.current_client_id == "outer"
+    assert service.current_client_id is None
+
+
+def test_current_cache_follows_client_id():
+    service = CacheService()
+    with service.set_client_id("client_a"):
+        service.current_cache["name"] = "value"
+    with service.set_client_id("client_b"):
+        assert "name" not in service.current_cache
+    with service.set_client_id("client_a"):
+        assert service.current_cache["name"] == "value"
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from langflow.services.socket.service import SocketIOService
+
+
+class FakeSio:
+    """Minimal stand-in for socketio.AsyncServer that records emits."""
+
+    def __init__(self):
+        self.emitted = []
+        self.fail_next = False
+
+    def event(self, handler):
+        return handler
+
+    def on(self, event):
+        def decorator(handler):
+            return handler
+
+        return decorator
+
+    async def emit(self, event, to=None, data=None):
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("emit failed")
+        self.emitted.append((event, to, data))
+
+
+@pytest.fixture
+def socket_service():
+    service = SocketIOService(cache_service=None)
+    service.init(FakeSio())
+    return service
+
+
+def batch_messages(sio):
+    return [[message["message"] for message in data["data"]] for _, _, data in sio.emitted]
+
+
+@pytest.mark.asyncio
+async def test_writer_coalesces_burst_into_one_frame(socket_service):
+    await socket_service.connect("sid1", {})
+    for i in range(5):
+        await socket_service.emit_token("sid1", {"message": str(i)})
+    await asyncio.sleep(0.01)
+
+    event, to, data = socket_service.sio.emitted[0]
+    assert event == "token"
+    assert to == "sid1"
+    assert data["type"] == "batch"
+    assert batch_messages(socket_service.sio) == [["0", "1", "2", "3", "4"]]
+
+
+@pytest.mark.asyncio
+async def test_writer_caps_batch_message_count(socket_service):
+    await socket_service.connect("sid1", {})
+    for i in range(SocketIOService.MAX_BATCH_MESSAGES + 1):
+        await socket_service.emit_token("sid1", {"message": str(i)})
+    await asyncio.sleep(0.01)
+
+    batch_sizes = [len(batch) for batch in batch_messages(socket_service.sio)]
+    assert batch_sizes == [SocketIOService.MAX_BATCH_MESSAGES, 1]
+
+
+@pytest.mark.asyncio
+async def test_writer_caps_batch_bytes(socket_service):
+    await socket_service.connect("sid1", {})
+    # Two of these exceed MAX_BATCH_BYTES, so three messages split 2 + 1
+    big_message = "x" * (SocketIOService.MAX_BATCH_BYTES // 2)
+    for _ in range(3):
+        await socket_service.emit_token("sid1", {"message": big_message})
+    await asyncio.sleep(0.01)
+
+    batch_sizes = [len(batch) for batch in batch_messages(socket_service.sio)]
+    assert batch_sizes == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_emit_token_blocks_when_queue_is_full(socket_service):
+    socket_service.sessions["sid1"] = {}
+    queue = asyncio.Queue(maxsize=2)
+    socket_service.send_queues["sid1"] = queue
+    queue.put_nowait({"message": "a"})
+    queue.put_nowait({"message": "b"})
+
+    put_task = asyncio.create_task(socket_service.emit_token("sid1", {"message": "c"}))
+    await asyncio.sleep(0.01)
+    assert not put_task.done()
+
+    # Draining one slot releases the blocked producer
+    queue.get_nowait()
+    await asyncio.wait_for(put_task, timeout=1)
+    assert queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_emit_token_to_gone_sid_does_not_create_writer(socket_service):
+    await socket_service.emit_token("gone", {"message": "x"})
+
+    assert "gone" not in socket_service.send_queues
+    assert "gone" not in socket_service.send_tasks
+    assert socket_service.sio.emitted == [("token", "gone", {"message": "x"})]
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cleans_up_writer(socket_service):
+    await socket_service.connect("sid1", {})
+    task = socket_service.send_tasks["sid1"]
+
+    await socket_service.disconnect("sid1")
+    await asyncio.sleep(0)
+
+    assert "sid1" not in socket_service.send_queues
+    assert "sid1" not in socket_service.send_tasks
+    assert task.done()
+
+
+@pytest.mark.asyncio
+async def test_writer_survives_emit_failure(socket_service):
+    await socket_service.connect("sid1", {})
+    socket_service.sio.fail_next = True
+
+    await socket_service.emit_token("sid1", {"message": "bad"})
+    await asyncio.sleep(0.01)
+    await socket_service.emit_token("sid1", {"message": "good"})
+    await asyncio.sleep(0.01)
+
+    # The failed batch is dropped but the writer keeps draining
+    assert batch_messages(socket_service.sio) == [["good"]]
+    assert "sid1" in socket_service.send_queues
@@ -0,0 +1,22 @@
+from langflow.services.state.service import InMemoryStateService
+
+
+def test_append_state_drops_oldest_beyond_cap():
+    service = InMemoryStateService(settings_service=None)
+    cap = InMemoryStateService.MAX_APPENDED_STATES
+
+    for i in range(cap + 10):
+        service.append_state("key", i, run_id="run")
+
+    states = service.get_state("key", run_id="run")
+    assert len(states) == cap
+    assert states[0] == 10
+    assert states[-1] == cap + 9
+
+
+def test_append_state_promotes_scalar_state():
+    service = InMemoryStateService(settings_service=None)
+    service.update_state("key", "first", run_id="run")
+    service.append_state("key", "second", run_id="run")
+
+    assert list(service.get_state("key", run_id="run")) == ["first", "second"]